@@ -3,7 +3,6 @@ Example usage of the MeshCapade SDK
 """
 
 import os
-import time
 import logging
 import meshcapade
 from dotenv import load_dotenv
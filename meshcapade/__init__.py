@@ -1,16 +1,51 @@
 """
 MeshCapade SDK - A Python client for interacting with the MeshCapade API
 """
+import logging
+import random
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # SDK version
 __version__ = "0.1.0"
 
+# The SDK logs through the "meshcapade" logger; applications decide whether and where it is shown
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
+from .config import Config, DEFAULT_API_URL
+
 # Base API URL for all requests
-API_URL = "https://api.meshcapade.com/api/v1"
+API_URL = DEFAULT_API_URL
 
 # API Key for authentication
 API_KEY = None
 
+class _JitteredRetry(Retry):
+    """urllib3 Retry that adds up to 50% random jitter to the exponential backoff
+    
+    Spreading the retries out keeps clients that failed together (e.g. on the same
+    429 burst) from all retrying at the same instant. Delays requested through
+    Retry-After are honoured as given, since urllib3 uses them instead of this backoff.
+    """
+    
+    def get_backoff_time(self):
+        backoff = super().get_backoff_time()
+        return backoff + random.uniform(0, backoff * 0.5) if backoff else backoff
+
+
+# Shared HTTP session so TCP connections and TLS sessions are reused by every client,
+# for API calls as well as pre-signed upload/download URLs. The Authorization header is
+# sent per request, so it never reaches the storage hosts behind pre-signed URLs.
+SESSION = requests.Session()
+# Idempotent requests are retried on transient server errors and on 429, where urllib3
+# waits for the Retry-After delay the server asks for. POST is not retried, since
+# repeating it could create a second avatar.
+_retry = _JitteredRetry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504], raise_on_status=False)
+_adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=_retry)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+
 def set_api_key(api_key: str):
     """Set the API key for authentication with Meshcapade API
     
@@ -31,6 +66,14 @@ def set_api_url(api_url: str):
     global API_URL
     API_URL = api_url
 
+def get_config():
+    """Get the current module-level settings as a Config
+    
+    Returns:
+        Config: The API key and URL set via set_api_key() and set_api_url()
+    """
+    return Config(api_key=API_KEY, api_url=API_URL)
+
 # Import exceptions for easier access
 from .exceptions import (
     MeshCapadeError,
@@ -44,13 +87,17 @@ from .exceptions import (
 # Import main components
 from .avatar import Avatar
 from .client import BaseClient
+from .async_client import AsyncBaseClient
 
 # For convenient imports
 __all__ = [
     'Avatar',
     'BaseClient',
+    'AsyncBaseClient',
+    'Config',
     'set_api_key',
     'set_api_url',
+    'get_config',
     'MeshCapadeError',
     'AuthenticationError',
     'APIError',
@@ -0,0 +1,142 @@
+"""
+Async client for MeshCapade API requests over HTTP/2
+"""
+import logging
+from .client import _ClientBase, _request_key, json_dumps
+from .exceptions import APIError
+
+logger = logging.getLogger(__name__)
+
+
+def require_httpx():
+    """Import and return httpx, raising a helpful error if it isn't installed
+    
+    httpx is imported on first use so users of the other clients don't need it.
+    """
+    try:
+        import httpx
+    except ImportError:
+        raise ImportError("httpx is required for AsyncBaseClient. "
+                          "Install it with `pip install 'httpx[http2]'`.") from None
+    return httpx
+
+
+class AsyncBaseClient(_ClientBase):
+    """Async client for the MeshCapade API built on httpx
+    
+    Requests run concurrently (e.g. under asyncio.gather) are multiplexed as HTTP/2
+    streams over a single TCP/TLS connection, so N concurrent API calls take about as
+    long as the slowest one. HTTP/2 needs the h2 package (`pip install 'httpx[http2]'`);
+    without it the client falls back to pooled HTTP/1.1 connections.
+    
+    Use it as an async context manager, or call aclose() when done:
+        
+        async with AsyncBaseClient() as client:
+            avatars, avatar = await asyncio.gather(
+                client.make_request("GET", "avatars"),
+                client.make_request("GET", "avatars/<avatar_id>"),
+            )
+    """
+    
+    __slots__ = ("_api_url", "_url_prefix", "_api_key", "_json_headers", "_auth_headers", "_client", "_owns_client",
+                 "_inflight")
+    
+    def __init__(self, api_key=None, api_url=None, config=None, client=None, http2=True):
+        """
+        Args:
+            api_key (str, optional): API key; defaults to config, then meshcapade.set_api_key()
+            api_url (str, optional): API base URL; defaults to config, then meshcapade.set_api_url()
+            config (Config, optional): Connection settings for this client
+            client (httpx.AsyncClient, optional): Client to send requests on. It is not
+                                                 closed by aclose(). A new one is created if omitted.
+            http2 (bool, optional): Whether a newly created client negotiates HTTP/2. Defaults to True.
+        """
+        self._configure(api_key, api_url, config)
+        self._owns_client = client is None
+        if client is None:
+            client = self._create_client(http2)
+        self._client = client
+        self._inflight = {}
+    
+    @staticmethod
+    def _create_client(http2):
+        """Create the pooled httpx.AsyncClient, falling back to HTTP/1.1 if h2 is missing"""
+        httpx = require_httpx()
+        options = {
+            "limits": httpx.Limits(max_connections=20, max_keepalive_connections=20),
+            "timeout": httpx.Timeout(30.0, connect=10.0),
+        }
+        if http2:
+            try:
+                return httpx.AsyncClient(http2=True, **options)
+            except ImportError:
+                logger.debug("h2 is not installed; AsyncBaseClient falls back to HTTP/1.1")
+        return httpx.AsyncClient(**options)
+    
+    async def aclose(self):
+        """Close the underlying httpx client, unless it was passed in by the caller"""
+        if self._owns_client:
+            await self._client.aclose()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+    
+    async def make_request(self, method, endpoint, data=None, headers=None, params=None):
+        """Make a request to the MeshCapade API.
+        
+        Concurrent identical GETs (same endpoint and params, no extra headers) are
+        collapsed into one request whose result is shared by all callers. They receive
+        the same dict object, so treat it as read-only. GETs whose params aren't a dict
+        of scalar values are sent uncollapsed.
+        
+        Args:
+            method (str): HTTP method (GET, POST, PUT, DELETE, etc.)
+            endpoint (str): API endpoint to call
+            data (dict, optional): JSON data to include in the request body
+            headers (dict, optional): Additional headers to include in the request
+            params (dict, optional): URL parameters
+        
+        Returns:
+            dict: The JSON response from the API
+        
+        Raises:
+            APIError: If the request fails
+            AuthenticationError: If authentication fails
+            ResourceNotFoundError: If the requested resource is not found
+        """
+        key = _request_key(endpoint, params) if method == "GET" and not (headers or data) else None
+        if key is None:
+            return await self._request(method, endpoint, data, headers, params)
+        
+        return await self._collapse_async(key, lambda: self._request(method, endpoint, data, headers, params))
+    
+    async def _request(self, method, endpoint, data=None, headers=None, params=None):
+        """Send one request and decode its response.
+        
+        Takes the same arguments as make_request().
+        """
+        httpx = require_httpx()
+        
+        default_headers = {**self._json_headers, **headers} if headers else self._json_headers
+        url = self._url_prefix + endpoint.lstrip("/")
+        logger.debug("Making async %s request to %s", method, url)
+        
+        try:
+            response = await self._client.request(
+                method,
+                url,
+                headers=default_headers,
+                content=json_dumps(data) if data else None,
+                params=params
+            )
+        except httpx.HTTPError as e:
+            raise APIError(f"Request failed: {str(e)}")
+        
+        logger.debug("Response status: %s (%s)", response.status_code, response.http_version)
+        
+        if response.status_code >= 400:
+            raise self._status_error(response.status_code, response.reason_phrase, url, response.content)
+        return self._decode_body(response.status_code, response.headers, response.content)
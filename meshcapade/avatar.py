@@ -2,22 +2,264 @@
 Avatar management module for the MeshCapade SDK
 """
 import os
+import stat
 import time
+import random
+import logging
+import mimetypes
+import warnings
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from urllib.parse import urlsplit, urlunsplit
 import requests
-from .client import BaseClient
+import urllib3
+from .client import BaseClient, async_session, require_aiohttp
 from .exceptions import ValidationError, APIError, TimeoutError
 
+logger = logging.getLogger(__name__)
+
+
+def _avatar_state(response):
+    """Extract the processing state from an avatar GET response"""
+    # Direct subscripts avoid building throwaway {} defaults on every poll
+    try:
+        return response["data"]["attributes"]["state"]
+    except (KeyError, TypeError):
+        return ""
+
+
+def _mesh_download_url(response):
+    """Return the first exported mesh URL in an avatar GET response, or None"""
+    for item in response.get("included", ()):
+        if item.get("type") != "asset":
+            continue
+        try:
+            path = item["attributes"]["url"]["path"]
+        except (KeyError, TypeError):
+            continue
+        if path:
+            return path
+    return None
+
+
+def _redact_url(url):
+    """Return url without its query string, which holds the signature of a pre-signed URL"""
+    parts = urlsplit(url)
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, "", ""))
+
+
+@dataclass(frozen=True)
+class _PresignedUpload:
+    """A pre-signed S3 URL for uploading one avatar image
+    
+    Args:
+        upload_url (str): The pre-signed URL to PUT the image to
+        image_id (str): The ID of the image resource created by the presign request
+    """
+    upload_url: str
+    image_id: str
+    
+    @classmethod
+    def parse(cls, response):
+        """Build a _PresignedUpload from a presign response, raising APIError if it has no upload URL"""
+        try:
+            data = response["data"]
+            return cls(data["links"]["upload"], data["id"])
+        except (KeyError, TypeError):
+            raise APIError("Failed to get upload URL") from None
+
+
+# Image types the stdlib mimetypes table may not know about
+_EXTRA_IMAGE_TYPES = {
+    ".heic": "image/heic",
+    ".heif": "image/heif",
+    ".webp": "image/webp",
+}
+
+
+def _guess_content_type(image_path):
+    """Guess the MIME type of an image file from its extension, defaulting to JPEG"""
+    content_type = mimetypes.guess_type(image_path)[0]
+    if content_type:
+        return content_type
+    return _EXTRA_IMAGE_TYPES.get(os.path.splitext(image_path)[1].lower(), "image/jpeg")
+
+
+def _collect_image_files(image_paths):
+    """Stat each image once, before any request is made.
+    
+    Missing paths, paths that aren't regular files and empty files (which the API
+    would reject) are logged and dropped, so no presign request (and no orphaned
+    image ID) is spent on them.
+    
+    Args:
+        image_paths (list): List of file paths to images
+    
+    Returns:
+        list: (path, size, content_type) tuples for the images that can be uploaded
+    """
+    image_files = []
+    for image_path in image_paths or ():
+        try:
+            st = os.stat(image_path)
+        except OSError:
+            logger.warning("Image file not found: %s", image_path)
+            continue
+        if not stat.S_ISREG(st.st_mode):
+            logger.warning("Not a regular file, skipping: %s", image_path)
+            continue
+        if st.st_size == 0:
+            logger.warning("Image file is empty, skipping: %s", image_path)
+            continue
+        image_files.append((image_path, st.st_size, _guess_content_type(image_path)))
+    return image_files
+
+
+def _uploadable_image_files(image_paths):
+    """Collect the image files to upload, raising ValidationError if none of them can be.
+    
+    Runs before the avatar is created, so a call without a usable image doesn't
+    leave an empty avatar behind on the server.
+    
+    Args:
+        image_paths (list): List of file paths to images; may be empty
+    
+    Returns:
+        list: (path, size, content_type) tuples, empty if no paths were given
+    """
+    image_files = _collect_image_files(image_paths)
+    if image_paths and not image_files:
+        raise ValidationError(f"No uploadable image among {', '.join(map(str, image_paths))}; "
+                              "each image must be an existing, non-empty regular file.")
+    return image_files
+
+
+# Processing states after which an avatar no longer changes
+_TERMINAL_STATES = frozenset(("READY", "FAILED", "ERROR"))
+
+# Accepted values for Avatar.gender
+_GENDERS = frozenset(("male", "female"))
+
+
+def _positive_int(value, message):
+    """Coerce value to a positive int, raising ValidationError(message) if it can't be.
+    
+    Accepts integral values in any form int() understands (e.g. 175.0, "175" or numpy
+    integers), so values read from CSV files or dataframes don't have to be converted
+    by the caller. Fractional numbers such as 175.7 are rejected rather than
+    truncated, and so are booleans.
+    """
+    if isinstance(value, bool):
+        raise ValidationError(message)
+    try:
+        number = int(value)
+    except (TypeError, ValueError, OverflowError):  # OverflowError: int(float('inf'))
+        raise ValidationError(message) from None
+    # int() truncates; a number that changed (175.7 -> 175) wasn't integral
+    if not isinstance(value, (str, bytes)) and number != value:
+        raise ValidationError(message)
+    if number <= 0:
+        raise ValidationError(message)
+    return number
+
+
+# Concurrent image uploads create_many() spreads across its avatars; matches the
+# connection pool size of meshcapade.SESSION
+_UPLOAD_CONNECTIONS = 32
+
+# Status polling in download_avatar() and download_avatar_async(): the first wait is
+# this short, and each further wait grows by _POLL_BACKOFF up to polling_interval
+_POLL_INITIAL_DELAY = 0.5
+_POLL_BACKOFF = 1.7
+
+
+def _poll_wait(delay, remaining):
+    """Return the time to sleep before the next status poll.
+    
+    Adds up to 10% random jitter to delay, so clients that started together don't
+    poll in lockstep, and never sleeps past the remaining time budget.
+    """
+    return min(delay + random.uniform(0, delay * 0.1), remaining)
+
+
+# (connect, read) timeout in seconds for mesh downloads from S3
+_DOWNLOAD_TIMEOUT = (5, 60)
+
+# Size of the byte ranges a mesh download is split into
+_DOWNLOAD_CHUNK_SIZE = 8 << 20
+
+
+def _content_range_total(response):
+    """Extract the total size from a 206 or 416 response's Content-Range header, or None"""
+    # Content-Range: bytes 0-8388607/52428800 (206) or bytes */0 (416)
+    total = response.headers.get("Content-Range", "").rpartition("/")[2]
+    return int(total) if total.isdigit() else None
+
+
+def _is_encoded(response):
+    """Whether the response body is sent with a Content-Encoding such as gzip"""
+    return response.headers.get("Content-Encoding", "identity").strip().lower() != "identity"
+
+
+# Request body used by Avatar.create_predefined_avatar()
+_PREDEFINED_AVATAR_BODY = {
+    "name": "Created from measurements API",
+    "gender": "female",
+    "measurements": {
+        "Height": 180,
+        "Weight": 87,
+        "Bust_girth": 109,
+        "Ankle_girth": 27,
+        "Thigh_girth": 70,
+        "Waist_girth": 94,
+        "Armscye_girth": 42,
+        "Top_hip_girth": 114,
+        "Neck_base_girth": 39,
+        "Shoulder_length": 10,
+        "Lower_arm_length": 24,
+        "Upper_arm_length": 35,
+        "Inside_leg_height": 83
+    }
+}
+
+# Predefined avatar IDs already created in this process, keyed by (api_url, api_key)
+_predefined_avatar_ids = {}
+
+
 class Avatar(BaseClient):
     """Class for managing avatars through the MeshCapade API"""
     
-    def __init__(self, api_key=None, api_url=None):
-        super().__init__(api_key, api_url)
+    __slots__ = ("_name", "_height", "_weight", "_gender", "avatar_id", "_metadata_body", "_avatar_cache")
+    
+    # API path of the avatar resources; the same for every instance
+    avatars_endpoint = "avatars"
+    
+    # get_avatar() results for avatars in a terminal state are reused for this many
+    # seconds, for at most this many avatars per client
+    avatar_cache_ttl = 60
+    avatar_cache_size = 256
+    
+    def __init__(self, api_key=None, api_url=None, session=None, config=None, *,
+                 name=None, height=None, weight=None, gender=None, owns_session=False):
+        super().__init__(api_key, api_url, session, config, owns_session)
         self._name = None
         self._height = None
         self._weight = None
         self._gender = None
         self.avatar_id = None
-        self.avatars_endpoint = "avatars"
+        self._metadata_body = None
+        self._avatar_cache = {}
+        
+        # Properties given here go through the same validation as the setters
+        if name is not None:
+            self.name = name
+        if height is not None:
+            self.height = height
+        if weight is not None:
+            self.weight = weight
+        if gender is not None:
+            self.gender = gender
     
     @property
     def name(self):
@@ -28,6 +270,7 @@ class Avatar(BaseClient):
     def name(self, value: str):
         """Set the avatar name"""
         self._name = value
+        self._metadata_body = None
         
     @property
     def height(self):
@@ -37,9 +280,8 @@ class Avatar(BaseClient):
     @height.setter
     def height(self, value: int):
         """Set the avatar height in cm"""
-        if not isinstance(value, int) or value <= 0:
-            raise ValidationError("Height must be a positive integer")
-        self._height = value
+        self._height = _positive_int(value, "Height must be a positive integer")
+        self._metadata_body = None
         
     @property
     def weight(self):
@@ -49,9 +291,8 @@ class Avatar(BaseClient):
     @weight.setter
     def weight(self, value: int):
         """Set the avatar weight in kg"""
-        if not isinstance(value, int) or value <= 0:
-            raise ValidationError("Weight must be a positive integer")
-        self._weight = value
+        self._weight = _positive_int(value, "Weight must be a positive integer")
+        self._metadata_body = None
         
     @property
     def gender(self):
@@ -61,11 +302,33 @@ class Avatar(BaseClient):
     @gender.setter
     def gender(self, value: str):
         """Set the avatar gender (male/female)"""
-        if value not in ["male", "female"]:
+        # The isinstance check keeps unhashable values from raising TypeError in the set lookup
+        if not isinstance(value, str) or value not in _GENDERS:
             raise ValidationError("Gender must be either 'male' or 'female'")
         self._gender = value
+        self._metadata_body = None
+    
+    def set_name(self, value):
+        """Set the avatar name and return the avatar, so calls can be chained"""
+        self.name = value
+        return self
+    
+    def set_height(self, value):
+        """Set the avatar height in cm and return the avatar, so calls can be chained"""
+        self.height = value
+        return self
     
-    def create_avatar_from_image(self, image_paths=None):
+    def set_weight(self, value):
+        """Set the avatar weight in kg and return the avatar, so calls can be chained"""
+        self.weight = value
+        return self
+    
+    def set_gender(self, value):
+        """Set the avatar gender (male/female) and return the avatar, so calls can be chained"""
+        self.gender = value
+        return self
+    
+    def create_avatar_from_image(self, image_paths=None, max_workers=8):
         """Create a new avatar through the complete creation process.
         
         This is a high-level method that orchestrates the complete avatar creation process:
@@ -77,32 +340,19 @@ class Avatar(BaseClient):
         Args:
             image_paths (list, optional): List of file paths to images to upload.
                                          Default is None.
+            max_workers (int, optional): Maximum number of images uploaded in parallel.
+                                        Defaults to 8.
         
         Returns:
             str: The created avatar ID
         
         Raises:
-            ValidationError: If required properties (name, gender) are not set
-            APIError: If the API request fails
+            ValidationError: If required properties (name, gender) are not set, or image
+                             paths were given but none of them is an uploadable file
+            APIError: If the API request fails or none of the images could be uploaded
         """
-        # Check if required properties are set
-        if self.name is None or self.gender is None:
-            raise ValidationError("Required properties (name, gender) must be set before creating an avatar. "
-                            "Use name and gender setters.")
-            
-        print(f"Creating avatar with name: {self.name}, gender: {self.gender}")
-        
-        # Prepare the body with required avatar metadata
-        body = {
-            "avatarname": self.name,
-            "gender": self.gender
-        }
-        
-        # Add optional parameters if they are set
-        if self.height is not None:
-            body["height"] = self.height
-        if self.weight is not None:
-            body["weight"] = self.weight
+        body = self._creation_body()
+        image_files = _uploadable_image_files(image_paths)
         
         # Step 1: Create an empty avatar
         avatar_data = self._create_empty_avatar(body)
@@ -113,21 +363,153 @@ class Avatar(BaseClient):
         
         # Store the avatar ID
         self.avatar_id = avatar_data['id']
-        print(f"Created empty avatar with ID: {self.avatar_id}")
+        logger.info("Created empty avatar with ID: %s", self.avatar_id)
         
         # Step 2: Upload images for the avatar
-        if image_paths:
-            print(f"Uploading images for avatar ID: {self.avatar_id}")
-            self._upload_images(self.avatar_id, image_paths)
-            print(f"Images uploaded for avatar ID: {self.avatar_id}")
+        if image_files:
+            logger.info("Uploading images for avatar ID: %s", self.avatar_id)
+            upload_result = self._upload_images(self.avatar_id, image_files, max_workers)
+            self._ensure_images_uploaded(upload_result)
+            logger.info("Images uploaded for avatar ID: %s", self.avatar_id)
         
-            # Step 3: Start the fitting process using the uploaded images
+            # Step 3: Start the fitting process as soon as the last upload has finished
             self._start_fitting_process(self.avatar_id)
-            print(f"Fitting process started for avatar ID: {self.avatar_id}")
+            logger.info("Fitting process started for avatar ID: %s", self.avatar_id)
 
         # Return the avatar ID
         return self.avatar_id
     
+    @classmethod
+    def create_many(cls, specs, api_key=None, api_url=None, session=None, config=None, max_workers=10):
+        """Create several avatars from images concurrently.
+        
+        Each spec is created by its own Avatar in a thread pool, and all of them share
+        one session (the pooled meshcapade.SESSION unless another is given), so
+        connections are reused across avatars. The avatars created at once split 32
+        image upload threads between them (at least one each), so the uploads of the
+        whole batch fit in the session's connection pool.
+        
+        Args:
+            specs (list): Dicts with "name" and "gender", and optionally "height",
+                          "weight" and "image_paths"
+            api_key (str, optional): API key, as for Avatar()
+            api_url (str, optional): API base URL, as for Avatar()
+            session (requests.Session, optional): Session shared by all avatars
+            config (Config, optional): Configuration, as for Avatar()
+            max_workers (int, optional): Maximum number of avatars created at once. Defaults to 10.
+        
+        Returns:
+            list: (spec, avatar_id) pairs in the order of specs. If creating an avatar
+                  failed, the exception it raised takes the place of its ID.
+        
+        Raises:
+            AuthenticationError: If no API key is configured
+        """
+        # Build the clients up front so a missing API key fails once, not per spec
+        avatars = [cls(api_key, api_url, session, config) for _ in specs]
+        
+        def create_one(avatar, spec):
+            try:
+                avatar.name = spec.get("name")
+                for prop in ("height", "weight", "gender"):
+                    if spec.get(prop) is not None:
+                        setattr(avatar, prop, spec[prop])
+                return spec, avatar.create_avatar_from_image(spec.get("image_paths"), upload_workers)
+            except Exception as e:
+                return spec, e
+        
+        if not specs:
+            return []
+        
+        workers = max(1, min(max_workers, len(specs)))
+        # Split the upload connections between the avatars created at once
+        upload_workers = max(1, _UPLOAD_CONNECTIONS // workers)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(create_one, avatars, specs))
+    
+    def create_avatar_from_stream(self, file_obj, content_length=None, content_type="image/jpeg"):
+        """Create a new avatar from an image held in a file-like object.
+        
+        Works like create_avatar_from_image() with a single image, but the image is
+        forwarded straight from file_obj to the pre-signed upload URL. This lets a
+        web service pass an incoming upload stream through without first saving
+        it to disk.
+        
+        Args:
+            file_obj (file-like): Readable binary stream with the image data. A stream that
+                                  can't seek is sent once: if S3 answers with a retryable
+                                  error, the upload fails with APIError instead of being retried.
+            content_length (int, optional): Size of the image in bytes. Setting it avoids
+                                           a chunked upload, which pre-signed URLs may reject.
+            content_type (str, optional): MIME type of the image. Defaults to "image/jpeg".
+        
+        Returns:
+            str: The created avatar ID
+        
+        Raises:
+            ValidationError: If required properties (name, gender) are not set
+            APIError: If the API request or the image upload fails
+        """
+        body = self._creation_body()
+        
+        avatar_data = self._create_empty_avatar(body)
+        if not avatar_data or 'id' not in avatar_data:
+            raise APIError("Failed to get avatar ID from API response.")
+        
+        self.avatar_id = avatar_data['id']
+        logger.info("Created empty avatar with ID: %s", self.avatar_id)
+        
+        result = self._upload_stream(self.avatar_id, file_obj, content_length, content_type)
+        if result["status"] != "success":
+            raise APIError(f"Image upload failed: {result['message']}")
+        logger.info("Image uploaded for avatar ID: %s", self.avatar_id)
+        
+        self._start_fitting_process(self.avatar_id)
+        logger.info("Fitting process started for avatar ID: %s", self.avatar_id)
+        
+        return self.avatar_id
+    
+    def _creation_body(self):
+        """Validate the avatar properties and build the create-from-images request body.
+        
+        Returns:
+            dict: The request body with the avatar metadata
+        
+        Raises:
+            ValidationError: If required properties (name, gender) are not set
+        """
+        # Read the backing slots directly; the setters have already validated them
+        name, gender = self._name, self._gender
+        
+        # Check if required properties are set, naming exactly the ones that are missing
+        missing = [prop for prop, value in (("name", name), ("gender", gender)) if value is None]
+        if missing:
+            raise ValidationError(f"Required properties must be set before creating an avatar: "
+                                  f"{', '.join(missing)}. Use the {' and '.join(missing)} setter(s).")
+            
+        logger.info("Creating avatar with name: %s, gender: %s", name, gender)
+        
+        # Required avatar metadata plus the optional parameters that are set
+        return {key: value for key, value in self._metadata().items() if value is not None}
+    
+    def _metadata(self):
+        """Return the avatar metadata request body.
+        
+        The body is shared by the create and fit requests, so it is built once and
+        only rebuilt after one of the name/height/weight/gender setters has run.
+        
+        Returns:
+            dict: The avatarname, height, weight and gender of the avatar
+        """
+        if self._metadata_body is None:
+            self._metadata_body = {
+                "avatarname": self._name,
+                "height": self._height,
+                "weight": self._weight,
+                "gender": self._gender
+            }
+        return self._metadata_body
+    
     def _create_empty_avatar(self, body=None):
         """Create an empty avatar entry in the system.
         
@@ -140,15 +522,10 @@ class Avatar(BaseClient):
         """
         # If body is not provided, use the instance attributes
         if body is None:
-            body = {
-                "avatarname": self.name,
-                "height": self.height,
-                "weight": self.weight,
-                "gender": self.gender
-            }
+            body = self._metadata()
         
         response = self.make_request("POST", f"{self.avatars_endpoint}/create/from-images", data=body)
-        print(f"Create empty avatar response: {response}")
+        logger.debug("Create empty avatar response: %s", response)
         
         if "data" in response and "id" in response["data"]:
             # Store avatar ID as an instance attribute for future operations
@@ -160,74 +537,412 @@ class Avatar(BaseClient):
         # If we get here, we couldn't extract the avatar ID
         raise APIError("Failed to create avatar: Invalid API response")
     
-    def _upload_images(self, avatar_id, image_paths=None):
+    def _upload_images(self, avatar_id, image_files, max_workers=8):
         """Upload images for avatar creation.
         
+        Each image is presigned and uploaded independently, so the uploads run in a
+        thread pool and share the pooled session's connections.
+        
         Args:
             avatar_id (str): The ID of the avatar to upload images for
-            image_paths (list): List of file paths to images to upload
+            image_files (list): (path, size, content_type) tuples from _collect_image_files()
+            max_workers (int, optional): Maximum number of concurrent uploads. Defaults to 8.
         
         Returns:
             dict: Response data from the image upload process
         """
-        if not image_paths:
-            print("No images provided for upload. Using default test images.")
-            # For demonstration purposes, assume we have default test images
-            # In a real implementation, this should raise an error if no images are provided
-            return {"status": "skipped", "message": "No images provided"}
+        image_files = list(image_files)
+        if not image_files:
+            return {"uploaded_images": []}
+        
+        workers = max(1, min(max_workers, len(image_files)))
+        if len(image_files) == 1:
+            # Nothing to overlap with, so upload inline rather than starting a thread
+            result = self._upload_single_image(avatar_id, *image_files[0])
+            upload_results = [result] if result is not None else []
+        elif workers == 1:
+            upload_results = self._upload_images_pipelined(avatar_id, image_files)
+        else:
+            # Start the largest files first so the slowest PUTs don't end up last in the queue
+            image_files.sort(key=lambda image_file: image_file[1], reverse=True)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = executor.map(lambda image_file: self._upload_single_image(avatar_id, *image_file),
+                                       image_files)
+                upload_results = [result for result in results if result is not None]
         
+        return {"uploaded_images": upload_results}
+    
+    def _upload_images_pipelined(self, avatar_id, image_files):
+        """Upload images one at a time, presigning the next image during the current PUT.
+        
+        Used when uploads must not run in parallel. The next presign request is sent
+        from a background thread while the current image is being PUT, so total time is
+        roughly one presign plus N uploads instead of N presigns plus N uploads. Each
+        file is opened before its presign is requested, so a file that has disappeared
+        doesn't leave an unused image ID on the avatar.
+        
+        Args:
+            avatar_id (str): The ID of the avatar to upload images for
+            image_files (list): (path, size, content_type) tuples from _collect_image_files()
+        
+        Returns:
+            list: The upload results, in the order of image_files
+        """
         upload_results = []
-        for image_path in image_paths:
-            if not os.path.exists(image_path):
-                print(f"Image file not found: {image_path}")
-                continue
-                
-            # STEP 1: Request a pre-signed URL for S3 upload
-            presigned_data = self.make_request("POST", f"{self.avatars_endpoint}/{avatar_id}/images")
-            print(f"Presigned URL response: {presigned_data}")
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            def start(image_file):
+                opened, result = self._open_image(image_file[0])
+                presign = executor.submit(self._request_upload_url, avatar_id) if opened is not None else None
+                return image_file, opened, presign, result
             
-            # Check if we received a valid response with an upload URL
-            if ("data" not in presigned_data or 
-                "links" not in presigned_data["data"] or 
-                "upload" not in presigned_data["data"]["links"]):
-                upload_results.append({
+            pending = start(image_files[0])
+            for index in range(len(image_files)):
+                image_file, opened, presign, result = pending
+                if index + 1 < len(image_files):
+                    pending = start(image_files[index + 1])
+                if opened is not None:
+                    with opened:
+                        try:
+                            presigned = presign.result()
+                        except APIError as e:
+                            result = {"status": "failed", "message": str(e), "file": os.path.basename(image_file[0])}
+                        else:
+                            result = self._put_image(avatar_id, opened, *image_file, presigned)
+                if result is not None:
+                    upload_results.append(result)
+        return upload_results
+    
+    def _request_upload_url(self, avatar_id):
+        """Request a pre-signed S3 URL for uploading one image.
+        
+        Args:
+            avatar_id (str): The ID of the avatar to upload the image for
+        
+        Returns:
+            _PresignedUpload: The upload URL and the ID of the new image
+        
+        Raises:
+            APIError: If the request fails or the response has no upload URL
+        """
+        presigned_data = self.make_request("POST", f"{self.avatars_endpoint}/{avatar_id}/images")
+        logger.debug("Presigned URL response: %s", presigned_data)
+        return _PresignedUpload.parse(presigned_data)
+    
+    def _open_image(self, image_path):
+        """Open one image file for upload.
+        
+        Args:
+            image_path (str): Path to the image file
+        
+        Returns:
+            tuple: (file, None) with the opened file, or (None, result) with the upload
+                   result to report instead (None if the file doesn't exist)
+        """
+        # The file may have been removed since it was stat'ed; other errors (e.g. a
+        # permission problem) fail just this image instead of the whole batch
+        try:
+            return open(image_path, 'rb'), None
+        except FileNotFoundError:
+            logger.warning("Image file not found: %s", image_path)
+            return None, None
+        except OSError as e:
+            logger.warning("Could not open image %s: %s", image_path, e)
+            return None, {
+                "status": "failed", 
+                "message": f"Could not open image: {e}",
+                "file": os.path.basename(image_path)
+            }
+    
+    def _upload_single_image(self, avatar_id, image_path, size, content_type):
+        """Request a pre-signed URL for one image and upload the file to it.
+        
+        Args:
+            avatar_id (str): The ID of the avatar to upload the image for
+            image_path (str): Path to the image file
+            size (int): Size of the image file in bytes
+            content_type (str): MIME type of the image
+        
+        Returns:
+            dict: The upload result for this image, or None if the file doesn't exist
+        """
+        image_file, result = self._open_image(image_path)
+        if image_file is None:
+            return result
+        
+        with image_file:
+            # STEP 1: Request a pre-signed URL for S3 upload. A failure only fails this
+            # image, so the other uploads in the batch still go ahead.
+            try:
+                presigned = self._request_upload_url(avatar_id)
+            except APIError as e:
+                return {
                     "status": "failed", 
-                    "message": "Failed to get upload URL", 
+                    "message": str(e), 
                     "file": os.path.basename(image_path)
-                })
-                continue
-            
-            # Extract the S3 upload URL
-            upload_url = presigned_data["data"]["links"]["upload"]
-            image_id = presigned_data["data"]["id"]
+                }
             
             # STEP 2: Upload the actual image to the pre-signed S3 URL
-            with open(image_path, 'rb') as image_file:
-                image_data = image_file.read()
-                
-                # S3 PUT request doesn't need authentication headers - the URL is pre-signed
-                s3_headers = {
-                    'Content-Type': 'image/jpeg'  # Adjust based on actual image type if needed
-                }
+            return self._put_image(avatar_id, image_file, image_path, size, content_type, presigned)
+    
+    def _put_image(self, avatar_id, image_file, image_path, size, content_type, presigned):
+        """Upload an opened image file to its pre-signed S3 URL.
+        
+        Args:
+            avatar_id (str): The ID of the avatar the image belongs to
+            image_file (file): The image file, opened in binary mode
+            image_path (str): Path to the image file
+            size (int): Size of the image file in bytes
+            content_type (str): MIME type of the image
+            presigned (_PresignedUpload): The pre-signed URL from _request_upload_url()
+        
+        Returns:
+            dict: The upload result for this image
+        """
+        # S3 PUT request doesn't need authentication headers - the URL is pre-signed.
+        # An explicit Content-Length keeps the streamed body from being sent chunked,
+        # which pre-signed PUTs reject.
+        s3_headers = {
+            'Content-Type': content_type,
+            'Content-Length': str(size)
+        }
+        
+        # Pass the file handle so requests streams it instead of reading it into memory.
+        # Like a failed presign, an unreachable upload URL only fails this image.
+        try:
+            s3_response = self.session.put(presigned.upload_url, headers=s3_headers, data=image_file)
+        except requests.exceptions.RequestException as e:
+            return {
+                "status": "failed", 
+                "message": f"S3 upload failed: {str(e)}",
+                "file": os.path.basename(image_path)
+            }
+        
+        logger.debug("S3 upload response: %s", s3_response.status_code)
+        if s3_response.status_code == 200:
+            return {
+                "status": "success", 
+                "message": "Image uploaded successfully",
+                "image_id": presigned.image_id,
+                "avatar_id": avatar_id,
+                "file": os.path.basename(image_path)
+            }
+        return {
+            "status": "failed", 
+            "message": f"S3 upload failed with status code: {s3_response.status_code}",
+            "file": os.path.basename(image_path)
+        }
+    
+    def _ensure_images_uploaded(self, upload_result):
+        """Check that at least one image was uploaded before fitting is started.
+        
+        Fitting an avatar without any uploaded image cannot succeed, so failing here
+        saves the fit-to-images round trip and a poll loop that would end in FAILED.
+        
+        Args:
+            upload_result (dict): The result returned by _upload_images()
+        
+        Raises:
+            APIError: If no image was uploaded successfully
+        """
+        uploaded = upload_result.get("uploaded_images", [])
+        if not any(result["status"] == "success" for result in uploaded):
+            failures = "; ".join(f"{r.get('file', '?')}: {r['message']}" for r in uploaded) or "image files disappeared before upload"
+            raise APIError(f"No images were uploaded for avatar {self.avatar_id} ({failures})")
+    
+    def _upload_stream(self, avatar_id, file_obj, content_length=None, content_type="image/jpeg"):
+        """Upload one image from a file-like object to a fresh pre-signed URL.
+        
+        Args:
+            avatar_id (str): The ID of the avatar to upload the image for
+            file_obj (file-like): Readable binary stream with the image data
+            content_length (int, optional): Size of the image in bytes
+            content_type (str, optional): MIME type of the image. Defaults to "image/jpeg".
+        
+        Returns:
+            dict: The upload result for this image
+        
+        Raises:
+            APIError: If no pre-signed URL could be obtained
+        """
+        presigned = self._request_upload_url(avatar_id)
+        
+        s3_headers = {'Content-Type': content_type}
+        if content_length is not None:
+            s3_headers['Content-Length'] = str(content_length)
+        
+        # requests streams file-like bodies instead of reading them into memory. The
+        # session retries a 5xx PUT by rewinding the body, which a non-seekable stream
+        # can't do; urllib3 then raises UnrewindableBodyError, reported here like any
+        # other transport failure.
+        try:
+            prepared = self.session.prepare_request(
+                requests.Request("PUT", presigned.upload_url, headers=s3_headers, data=file_obj)
+            )
+            if content_length is not None:
+                # When tell() fails (sockets, pipes, stdin) requests can't size the body and
+                # adds Transfer-Encoding: chunked next to our Content-Length. The body is
+                # then sent unchunked, so the header would misframe the request.
+                prepared.headers.pop("Transfer-Encoding", None)
+                prepared.headers["Content-Length"] = str(content_length)
+            settings = self.session.merge_environment_settings(prepared.url, {}, None, None, None)
+            s3_response = self.session.send(prepared, **settings)
+        except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError) as e:
+            return {
+                "status": "failed", 
+                "message": f"S3 upload failed: {str(e)}"
+            }
+        logger.debug("S3 upload response: %s", s3_response.status_code)
+        if s3_response.status_code == 200:
+            return {
+                "status": "success", 
+                "message": "Image uploaded successfully",
+                "image_id": presigned.image_id,
+                "avatar_id": avatar_id
+            }
+        return {
+            "status": "failed", 
+            "message": f"S3 upload failed with status code: {s3_response.status_code}"
+        }
+    
+    async def create_avatar_from_image_async(self, image_paths=None, max_concurrency=8, session=None):
+        """Create a new avatar from images without blocking the event loop.
+        
+        Async counterpart of create_avatar_from_image(). All images are uploaded
+        concurrently over one aiohttp session, so the upload step takes roughly as
+        long as the slowest image rather than the sum of all of them. Requires aiohttp.
+        
+        Args:
+            image_paths (list, optional): List of file paths to images to upload.
+                                         Default is None.
+            max_concurrency (int, optional): Maximum number of images uploaded at once.
+                                            Defaults to 8.
+            session (aiohttp.ClientSession, optional): Session to reuse, e.g. when creating
+                                                      many avatars concurrently. A new one is
+                                                      created for this call if not provided.
+        
+        Returns:
+            str: The created avatar ID
+        
+        Raises:
+            ValidationError: If required properties (name, gender) are not set, or image
+                             paths were given but none of them is an uploadable file
+            APIError: If the API request fails or none of the images could be uploaded
+        """
+        body = self._creation_body()
+        image_files = _uploadable_image_files(image_paths)
+        
+        async with async_session(session) as session:
+            response = await self.make_request_async(
+                session, "POST", f"{self.avatars_endpoint}/create/from-images", data=body
+            )
+            if "data" not in response or "id" not in response["data"]:
+                raise APIError("Failed to create avatar: Invalid API response")
+            
+            self.avatar_id = response["data"]["id"]
+            logger.info("Created empty avatar with ID: %s", self.avatar_id)
+            
+            if image_files:
+                logger.info("Uploading images for avatar ID: %s", self.avatar_id)
+                upload_result = await self._upload_images_async(session, self.avatar_id, image_files, max_concurrency)
+                self._ensure_images_uploaded(upload_result)
+                logger.info("Images uploaded for avatar ID: %s", self.avatar_id)
                 
-                s3_response = requests.put(upload_url, headers=s3_headers, data=image_data)
-                print(f"S3 upload response: {s3_response.status_code}")
-                if s3_response.status_code == 200:
-                    upload_results.append({
-                        "status": "success", 
-                        "message": "Image uploaded successfully",
-                        "image_id": image_id,
-                        "avatar_id": avatar_id,
-                        "file": os.path.basename(image_path)
-                    })
-                else:
-                    upload_results.append({
-                        "status": "failed", 
-                        "message": f"S3 upload failed with status code: {s3_response.status_code}",
-                        "file": os.path.basename(image_path)
-                    })
+                await self.make_request_async(
+                    session, "POST", f"{self.avatars_endpoint}/{self.avatar_id}/fit-to-images", data=self._metadata()
+                )
+                logger.info("Fitting process started for avatar ID: %s", self.avatar_id)
         
-        return {"uploaded_images": upload_results}
+        return self.avatar_id
+    
+    async def _upload_images_async(self, session, avatar_id, image_files, max_concurrency=8):
+        """Upload images for avatar creation concurrently.
+        
+        Args:
+            session (aiohttp.ClientSession): Session shared by all uploads
+            avatar_id (str): The ID of the avatar to upload images for
+            image_files (list): (path, size, content_type) tuples from _collect_image_files()
+            max_concurrency (int, optional): Maximum number of uploads in flight. Defaults to 8.
+        
+        Returns:
+            dict: Response data from the image upload process
+        """
+        import asyncio
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def upload_one(image_file):
+            async with semaphore:
+                return await self._upload_image_async(session, avatar_id, *image_file)
+        
+        # Largest files first, so the slowest uploads get a semaphore slot earliest
+        image_files = sorted(image_files, key=lambda image_file: image_file[1], reverse=True)
+        upload_results = await asyncio.gather(*[upload_one(f) for f in image_files])
+        return {"uploaded_images": [result for result in upload_results if result is not None]}
+    
+    async def _upload_image_async(self, session, avatar_id, image_path, size, content_type):
+        """Request a pre-signed URL for one image and stream the file to it.
+        
+        Args:
+            session (aiohttp.ClientSession): Session to send the requests on
+            avatar_id (str): The ID of the avatar to upload the image for
+            image_path (str): Path to the image file
+            size (int): Size of the image file in bytes
+            content_type (str): MIME type of the image
+        
+        Returns:
+            dict: The upload result for this image, or None if the file no longer exists
+        """
+        aiohttp = require_aiohttp()
+        
+        # A failed presign only fails this image; raising would abort the whole gather()
+        try:
+            presigned_data = await self.make_request_async(session, "POST", f"{self.avatars_endpoint}/{avatar_id}/images")
+            presigned = _PresignedUpload.parse(presigned_data)
+        except APIError as e:
+            return {
+                "status": "failed", 
+                "message": str(e), 
+                "file": os.path.basename(image_path)
+            }
+        
+        # Passing the open file lets aiohttp stream it in chunks with a fixed Content-Length
+        s3_headers = {'Content-Type': content_type, 'Content-Length': str(size)}
+        try:
+            with open(image_path, 'rb') as image_file:
+                async with session.put(presigned.upload_url, headers=s3_headers, data=image_file) as s3_response:
+                    status_code = s3_response.status
+        except FileNotFoundError:
+            logger.warning("Image file not found: %s", image_path)
+            return None
+        except aiohttp.ClientError as e:
+            return {
+                "status": "failed", 
+                "message": f"S3 upload failed: {str(e)}",
+                "file": os.path.basename(image_path)
+            }
+        except OSError as e:
+            # Checked after ClientError, since aiohttp's connection errors are OSErrors too
+            logger.warning("Could not open image %s: %s", image_path, e)
+            return {
+                "status": "failed", 
+                "message": f"Could not open image: {e}",
+                "file": os.path.basename(image_path)
+            }
+        
+        logger.debug("S3 upload response: %s", status_code)
+        if status_code == 200:
+            return {
+                "status": "success", 
+                "message": "Image uploaded successfully",
+                "image_id": presigned.image_id,
+                "avatar_id": avatar_id,
+                "file": os.path.basename(image_path)
+            }
+        return {
+            "status": "failed", 
+            "message": f"S3 upload failed with status code: {status_code}",
+            "file": os.path.basename(image_path)
+        }
     
     def _start_fitting_process(self, avatar_id):
         """Start the fitting process to create an avatar from uploaded images.
@@ -238,20 +953,16 @@ class Avatar(BaseClient):
         Returns:
             dict: Response data from the fitting process initiation
         """
-        # Prepare the request body with avatar details
-        body = {
-            "avatarname": self.name,
-            "height": self.height,
-            "weight": self.weight,
-            "gender": self.gender
-        }
-        
-        # Send the fit-to-images request
-        return self.make_request("POST", f"{self.avatars_endpoint}/{avatar_id}/fit-to-images", body)
+        # Send the fit-to-images request with the avatar details
+        return self.make_request("POST", f"{self.avatars_endpoint}/{avatar_id}/fit-to-images", self._metadata())
     
     def get_avatar(self, avatar_id=None):
         """Get the processed avatar data after fitting is complete.
         
+        Once an avatar is READY (or has failed) its data no longer changes, so the
+        response is kept for avatar_cache_ttl seconds and repeated calls within that
+        window don't hit the network.
+        
         Args:
             avatar_id (str, optional): The ID of the avatar to retrieve.
                                       If not provided, uses the current avatar_id.
@@ -262,10 +973,25 @@ class Avatar(BaseClient):
         avatar_id = avatar_id or self.avatar_id
         if not avatar_id:
             raise ValidationError("No avatar ID provided. Create an avatar first or provide an ID.")
-            
-        return self.make_request("GET", f"{self.avatars_endpoint}/{avatar_id}")
+        
+        # Avatars that are READY or have failed don't change, so a recent response for
+        # one of them is returned without another request
+        cached = self._avatar_cache.get(avatar_id)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        
+        response = self.get_conditional(f"{self.avatars_endpoint}/{avatar_id}")
+        if _avatar_state(response) in _TERMINAL_STATES:
+            # Keep the cache bounded by evicting the oldest entry
+            if avatar_id not in self._avatar_cache and len(self._avatar_cache) >= self.avatar_cache_size:
+                self._avatar_cache.pop(next(iter(self._avatar_cache)), None)
+            self._avatar_cache[avatar_id] = (time.monotonic() + self.avatar_cache_ttl, response)
+        else:
+            self._avatar_cache.pop(avatar_id, None)
+        return response
     
-    def download_avatar(self, avatar_id=None, filename="avatar.obj", polling_interval=5, max_retries=60):
+    def download_avatar(self, avatar_id=None, filename="avatar.obj", polling_interval=5, max_retries=60,
+                        max_wait_seconds=None):
         """Download the avatar 3D model.
         
         This method polls the API until the avatar is ready for download,
@@ -276,10 +1002,15 @@ class Avatar(BaseClient):
                                       If not provided, uses the current avatar_id.
             filename (str, optional): The filename to save the avatar model to.
                                      Defaults to "avatar.obj".
-            polling_interval (int, optional): How often to check if the avatar is ready, in seconds.
+            polling_interval (int, optional): Longest delay between status checks, in seconds.
+                                            Polling starts after 0.5 seconds and backs off
+                                            exponentially (with jitter) up to this value.
                                             Defaults to 5 seconds.
-            max_retries (int, optional): Maximum number of polling attempts.
+            max_retries (int, optional): Used with polling_interval to compute the time budget
+                                        (max_retries * polling_interval seconds).
                                         Defaults to 60 (about 5 minutes with default interval).
+            max_wait_seconds (float, optional): Total time to wait for the avatar, in seconds.
+                                               Overrides the budget derived from max_retries.
         
         Returns:
             str: The path to the downloaded file
@@ -289,60 +1020,261 @@ class Avatar(BaseClient):
             TimeoutError: If avatar processing takes too long
             APIError: If avatar processing fails
         """
-        import time
-        import requests
-        import os
-        
         # Use the provided avatar_id or fall back to the instance's avatar_id
         avatar_id = avatar_id or self.avatar_id
         if not avatar_id:
             raise ValidationError("No avatar ID provided. Create an avatar first or provide an ID.")
             
-        print(f"Checking avatar {avatar_id} for download...")
+        logger.debug("Checking avatar %s for download...", avatar_id)
         
-        # Function to poll the API until the avatar is ready
-        retry_count = 0
-        print("Polling for avatar readiness...")
+        # Poll the API until the avatar is ready. Starting with a short delay notices
+        # quick avatars early; backing off keeps the request count bounded.
+        timeout = max_wait_seconds if max_wait_seconds is not None else max_retries * polling_interval
+        deadline = time.monotonic() + timeout
+        initial_delay = delay = min(_POLL_INITIAL_DELAY, polling_interval)
+        previous_state = None
+        logger.debug("Polling for avatar readiness...")
         
-        while retry_count < max_retries:
-            # Get the current status of the avatar
-            params = {"include": "exported_mesh"}
-            response = self.make_request("GET", f"{self.avatars_endpoint}/{avatar_id}", params=params)
+        # The deadline is checked after each poll, so the avatar is always polled at
+        # least once, even with a zero time budget
+        while True:
+            # Get the current status of the avatar. The exported mesh is only
+            # included once the avatar is ready, to keep the status polls light, and
+            # unchanged responses come back as bodiless 304s via their ETag.
+            response = self.get_conditional(f"{self.avatars_endpoint}/{avatar_id}")
             
-            state = response.get("data", {}).get("attributes", {}).get("state", "")
-            print(f"Current state: {state}")
+            state = _avatar_state(response)
+            logger.debug("Current state: %s", state)
+            
+            # A state change means processing is moving, so poll closely again
+            if previous_state is not None and state != previous_state:
+                delay = initial_delay
+            previous_state = state
             
             # Check if the avatar is ready for download
             if state == "READY":
                 # Look for mesh URLs in the included array
-                included = response.get("included", [])
-                
-                for item in included:
-                    if item.get("type") == "asset" and item.get("attributes", {}).get("url", {}).get("path"):
-                        download_url = item.get("attributes", {}).get("url", {}).get("path", "")
-                        if download_url:
-                            # Download the avatar file
-                            print(f"Downloading avatar from: {download_url}")
-                            response = requests.get(download_url)
-                            response.raise_for_status()
-                            
-                            # Save to file
-                            with open(filename, "wb") as f:
-                                f.write(response.content)
-                            
-                            print(f"Avatar saved to {os.path.abspath(filename)}")
-                            return filename
+                params = {"include": "exported_mesh"}
+                response = self.make_request("GET", f"{self.avatars_endpoint}/{avatar_id}", params=params)
+                download_url = _mesh_download_url(response)
+                if download_url:
+                    # Download the avatar file
+                    logger.info("Downloading avatar %s", avatar_id)
+                    logger.debug("Downloading avatar from: %s", _redact_url(download_url))
+                    self._download_to_file(download_url, filename)
+                    
+                    logger.info("Avatar saved to %s", os.path.abspath(filename))
+                    return filename
                 
-                print("Avatar is ready but no suitable download URL was found")
+                logger.warning("Avatar is ready but no suitable download URL was found")
             elif state == "FAILED" or state == "ERROR":
                 raise APIError(f"Avatar processing failed with state: {state}")
             
-            # Wait before polling again
-            time.sleep(polling_interval)
-            retry_count += 1
+            # Stop once the time budget is spent, otherwise wait before polling again
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(_poll_wait(delay, remaining))
+            delay = min(delay * _POLL_BACKOFF, polling_interval)
+        
+        # If we've exhausted our time budget, raise a timeout error
+        raise TimeoutError(f"Avatar processing timed out after {timeout} seconds")
+    
+    def _download_to_file(self, download_url, filename, max_workers=8):
+        """Download a file to disk, fetching large files as parallel byte ranges.
+        
+        The first request asks for the first _DOWNLOAD_CHUNK_SIZE bytes. If the server
+        ignores the Range header or the file fits into that chunk, it is the only
+        request. Otherwise the remaining ranges are fetched concurrently on the pooled
+        session and written at their offsets in the file.
+        
+        The data is written to filename + ".part" and moved into place once complete,
+        so an interrupted download never leaves a truncated file under filename.
+        
+        Args:
+            download_url (str): The (pre-signed) URL of the file
+            filename (str): The path to save the file to
+            max_workers (int, optional): Maximum number of concurrent range requests. Defaults to 8.
+        
+        Raises:
+            APIError: If the download fails
+        """
+        part_filename = filename + ".part"
+        range_header = {"Range": f"bytes=0-{_DOWNLOAD_CHUNK_SIZE - 1}"}
+        try:
+            with self.session.get(download_url, headers=range_header, stream=True,
+                                  timeout=_DOWNLOAD_TIMEOUT) as response:
+                total_size = _content_range_total(response) if response.status_code in (206, 416) else None
+                if response.status_code == 416 and total_size == 0:
+                    # An empty object has no byte 0 to serve, so the range is unsatisfiable
+                    open(part_filename, "wb").close()
+                elif response.status_code == 206 and (total_size is None or _is_encoded(response)):
+                    # A partial response we can't place in the file, or ranges of an encoded
+                    # body: their offsets count encoded bytes, but iter_content decodes each
+                    # range on its own. Fetch the file whole instead.
+                    total_size = None
+                    response.close()
+                    self._download_range(download_url, part_filename, None)
+                else:
+                    response.raise_for_status()
+                    # Stream to file so memory use doesn't grow with the file size
+                    with open(part_filename, "wb") as f:
+                        for chunk in response.iter_content(chunk_size=1 << 20):
+                            f.write(chunk)
+                        if total_size:
+                            f.truncate(total_size)
+            
+            if total_size and total_size > _DOWNLOAD_CHUNK_SIZE:
+                ranges = [
+                    (start, min(start + _DOWNLOAD_CHUNK_SIZE, total_size) - 1)
+                    for start in range(_DOWNLOAD_CHUNK_SIZE, total_size, _DOWNLOAD_CHUNK_SIZE)
+                ]
+                logger.debug("Downloading remaining %d byte ranges of %s", len(ranges), filename)
+                with ThreadPoolExecutor(max_workers=min(max_workers, len(ranges))) as executor:
+                    # list() re-raises the first failed range
+                    list(executor.map(lambda byte_range: self._download_range(download_url, part_filename, byte_range),
+                                      ranges))
+            
+            os.replace(part_filename, filename)
+        except BaseException as e:
+            if os.path.exists(part_filename):
+                os.remove(part_filename)
+            if isinstance(e, requests.exceptions.RequestException):
+                raise APIError(f"Avatar download failed: {str(e)}") from e
+            raise
+    
+    def _download_range(self, download_url, part_filename, byte_range):
+        """Download one byte range of a file into its offset in part_filename.
+        
+        Args:
+            download_url (str): The (pre-signed) URL of the file
+            part_filename (str): The file to write to. Must already exist unless byte_range is None.
+            byte_range (tuple): Inclusive (start, end) offsets, or None to download the whole file
+        
+        Raises:
+            APIError: If the server doesn't return the requested range
+        """
+        headers = {"Range": f"bytes={byte_range[0]}-{byte_range[1]}"} if byte_range else None
+        with self.session.get(download_url, headers=headers, stream=True, timeout=_DOWNLOAD_TIMEOUT) as response:
+            response.raise_for_status()
+            if byte_range and response.status_code != 206:
+                raise APIError(f"Range request failed with status code: {response.status_code}")
+            
+            # Each range gets its own file handle, so concurrent writers don't share a position
+            with open(part_filename, "r+b" if byte_range else "wb") as f:
+                if byte_range:
+                    f.seek(byte_range[0])
+                for chunk in response.iter_content(chunk_size=1 << 20):
+                    f.write(chunk)
+    
+    async def download_avatar_async(self, avatar_id=None, filename="avatar.obj", polling_interval=5,
+                                    max_retries=60, max_interval=None, session=None, max_wait_seconds=None):
+        """Download the avatar 3D model without blocking the event loop.
+        
+        Async counterpart of download_avatar(), polling on the same schedule: the
+        first check waits 0.5 seconds and the delay backs off exponentially (with
+        jitter) up to polling_interval, within a budget of max_retries *
+        polling_interval seconds. Waiting uses asyncio.sleep, so many downloads can
+        wait concurrently on a single thread. Requires aiohttp.
+        
+        Args:
+            avatar_id (str, optional): The ID of the avatar to download.
+                                      If not provided, uses the current avatar_id.
+            filename (str, optional): The filename to save the avatar model to.
+                                     Defaults to "avatar.obj".
+            polling_interval (int, optional): Longest delay between status checks, in seconds.
+                                            Polling starts after 0.5 seconds and backs off
+                                            exponentially (with jitter) up to this value.
+                                            Defaults to 5 seconds.
+            max_retries (int, optional): Used with polling_interval to compute the time budget
+                                        (max_retries * polling_interval seconds).
+                                        Defaults to 60 (about 5 minutes with default interval).
+            max_interval (int, optional): Deprecated; polling_interval is the backoff ceiling.
+                                         If given, it lowers that ceiling further.
+            max_wait_seconds (float, optional): Total time to wait for the avatar, in seconds.
+                                               Overrides the budget derived from max_retries.
+            session (aiohttp.ClientSession, optional): Session to reuse across downloads.
+                                                      A new one is created if not provided.
+        
+        Returns:
+            str: The path to the downloaded file
+        
+        Raises:
+            ValidationError: If avatar_id is not provided and there's no current avatar_id
+            TimeoutError: If avatar processing takes too long
+            APIError: If avatar processing fails
+        """
+        import asyncio
+        aiohttp = require_aiohttp()
+        
+        avatar_id = avatar_id or self.avatar_id
+        if not avatar_id:
+            raise ValidationError("No avatar ID provided. Create an avatar first or provide an ID.")
+        
+        timeout = max_wait_seconds if max_wait_seconds is not None else max_retries * polling_interval
+        deadline = time.monotonic() + timeout
+        if max_interval is not None:
+            warnings.warn("max_interval is deprecated; polling_interval is the longest delay between "
+                          "status checks, as in download_avatar()", DeprecationWarning, stacklevel=2)
+        ceiling = polling_interval if max_interval is None else min(polling_interval, max_interval)
+        initial_delay = delay = min(_POLL_INITIAL_DELAY, ceiling)
+        previous_state = None
+        
+        async with async_session(session) as session:
+            # As in download_avatar(), the deadline is checked after each poll
+            while True:
+                response = await self.make_request_async(session, "GET", f"{self.avatars_endpoint}/{avatar_id}")
+                
+                state = _avatar_state(response)
+                logger.debug("Current state: %s", state)
+                
+                # A state change means processing is moving, so poll closely again
+                if previous_state is not None and state != previous_state:
+                    delay = initial_delay
+                previous_state = state
+                
+                if state == "READY":
+                    params = {"include": "exported_mesh"}
+                    response = await self.make_request_async(
+                        session, "GET", f"{self.avatars_endpoint}/{avatar_id}", params=params
+                    )
+                    download_url = _mesh_download_url(response)
+                    if download_url:
+                        logger.info("Downloading avatar %s", avatar_id)
+                        logger.debug("Downloading avatar from: %s", _redact_url(download_url))
+                        part_filename = filename + ".part"
+                        connect_timeout, read_timeout = _DOWNLOAD_TIMEOUT
+                        try:
+                            async with session.get(
+                                download_url,
+                                timeout=aiohttp.ClientTimeout(sock_connect=connect_timeout, sock_read=read_timeout)
+                            ) as mesh_response:
+                                mesh_response.raise_for_status()
+                                with open(part_filename, "wb") as f:
+                                    async for chunk in mesh_response.content.iter_chunked(1 << 20):
+                                        f.write(chunk)
+                            os.replace(part_filename, filename)
+                        except BaseException as e:
+                            if os.path.exists(part_filename):
+                                os.remove(part_filename)
+                            if isinstance(e, aiohttp.ClientError):
+                                raise APIError(f"Avatar download failed: {str(e)}")
+                            raise
+                        
+                        logger.info("Avatar saved to %s", os.path.abspath(filename))
+                        return filename
+                    
+                    logger.warning("Avatar is ready but no suitable download URL was found")
+                elif state == "FAILED" or state == "ERROR":
+                    raise APIError(f"Avatar processing failed with state: {state}")
+                
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                await asyncio.sleep(_poll_wait(delay, remaining))
+                delay = min(delay * _POLL_BACKOFF, ceiling)
         
-        # If we've exhausted our retries, raise a timeout error
-        raise TimeoutError(f"Avatar processing timed out after {max_retries * polling_interval} seconds")
+        raise TimeoutError(f"Avatar processing timed out after {timeout} seconds")
     
     def delete_avatar(self, avatar_id=None):
         """Delete an avatar.
@@ -358,7 +1290,15 @@ class Avatar(BaseClient):
         if not avatar_id:
             raise ValidationError("No avatar ID provided. Create an avatar first or provide an ID.")
             
-        return self.make_request("DELETE", f"{self.avatars_endpoint}/{avatar_id}")
+        response = self.make_request("DELETE", f"{self.avatars_endpoint}/{avatar_id}")
+        self._avatar_cache.pop(avatar_id, None)
+        
+        # Forget a deleted predefined avatar so the next call creates a fresh one
+        cache_key = (self.api_url, self.api_key)
+        if _predefined_avatar_ids.get(cache_key) == avatar_id:
+            del _predefined_avatar_ids[cache_key]
+        
+        return response
     
     def list_avatars(self, page=1, page_size=10):
         """List all avatars for the current API key.
@@ -376,7 +1316,40 @@ class Avatar(BaseClient):
             "limit": page_size
         }
         
-        return self.make_request("GET", f"{self.avatars_endpoint}", params=params)
+        return self.get_conditional(f"{self.avatars_endpoint}", params=params)
+    
+    def iter_avatars(self, page_size=100, prefetch=4):
+        """Iterate over all avatars for the current API key.
+        
+        Pages are fetched in a background thread pool that keeps up to `prefetch`
+        pages in flight ahead of the consumer, so pagination round trips overlap
+        with processing instead of adding up. Iteration stops at the first page
+        with fewer than page_size avatars.
+        
+        Args:
+            page_size (int, optional): Number of items per page. Defaults to 100.
+            prefetch (int, optional): Number of pages requested ahead. Defaults to 4.
+        
+        Yields:
+            dict: One avatar resource at a time, in page order
+        """
+        prefetch = max(1, prefetch)
+        with ThreadPoolExecutor(max_workers=prefetch) as executor:
+            pending = deque(executor.submit(self.list_avatars, page, page_size) for page in range(1, prefetch + 1))
+            next_page = prefetch + 1
+            
+            while pending:
+                avatars = pending.popleft().result().get("data", [])
+                if len(avatars) < page_size:
+                    # Last page: pages requested beyond it are not needed
+                    for future in pending:
+                        future.cancel()
+                    yield from avatars
+                    return
+                
+                pending.append(executor.submit(self.list_avatars, next_page, page_size))
+                next_page += 1
+                yield from avatars
     
     def create_avatar_from_measurements(self, name=None, gender=None, measurements=None):
         """Create a new avatar from body measurements.
@@ -414,8 +1387,8 @@ class Avatar(BaseClient):
             APIError: If the API request fails
         """
         # Use provided values or fall back to instance attributes
-        avatar_name = name or self.name
-        avatar_gender = gender or self.gender
+        avatar_name = name or self._name
+        avatar_gender = gender or self._gender
         
         # Validate required parameters
         if not avatar_name:
@@ -424,18 +1397,19 @@ class Avatar(BaseClient):
         if not avatar_gender:
             raise ValidationError("Gender is required")
             
-        if avatar_gender not in ["male", "female"]:
+        if not isinstance(avatar_gender, str) or avatar_gender not in _GENDERS:
             raise ValidationError("Gender must be either 'male' or 'female'")
         
         # If no measurements are provided, use height and weight from instance
         if not measurements:
-            if self.height is None or self.weight is None:
+            height, weight = self._height, self._weight
+            if height is None or weight is None:
                 raise ValidationError(
                     "Measurements dict is required or height and weight must be set on the instance"
                 )
             measurements = {
-                "Height": self.height,
-                "Weight": self.weight
+                "Height": height,
+                "Weight": weight
             }
         
         # Prepare the body with required avatar metadata
@@ -445,7 +1419,7 @@ class Avatar(BaseClient):
             "measurements": measurements
         }
         
-        print(f"Creating avatar from measurements with name: {avatar_name}, gender: {avatar_gender}")
+        logger.info("Creating avatar from measurements with name: %s, gender: %s", avatar_name, avatar_gender)
         
         # Send the request
         response = self.make_request("POST", f"{self.avatars_endpoint}/create/from-measurements", data=body)
@@ -454,17 +1428,23 @@ class Avatar(BaseClient):
         if "data" in response and "id" in response["data"]:
             # Store avatar ID as an instance attribute for future operations
             self.avatar_id = response["data"]["id"]
-            print(f"Created avatar with ID: {self.avatar_id}")
+            logger.info("Created avatar with ID: %s", self.avatar_id)
             return self.avatar_id
                     
         # If we get here, we couldn't extract the avatar ID
         raise APIError("Failed to create avatar from measurements: Invalid API response")
     
-    def create_predefined_avatar(self):
+    def create_predefined_avatar(self, refresh=False):
         """Create a new avatar with predefined measurements.
         
         This method sends a POST request to create an avatar with a specific set
-        of predefined body measurements.
+        of predefined body measurements. The request always produces an identical
+        avatar, so the created ID is remembered per API key and URL and returned by
+        later calls in the same process instead of creating duplicates.
+        
+        Args:
+            refresh (bool, optional): Create a new avatar even if one was already created.
+                                     Defaults to False.
         
         Returns:
             str: The created avatar ID
@@ -472,37 +1452,24 @@ class Avatar(BaseClient):
         Raises:
             APIError: If the API request fails
         """
-        # Predefined body for the request
-        body = {
-            "name": "Created from measurements API",
-            "gender": "female",
-            "measurements": {
-                "Height": 180,
-                "Weight": 87,
-                "Bust_girth": 109,
-                "Ankle_girth": 27,
-                "Thigh_girth": 70,
-                "Waist_girth": 94,
-                "Armscye_girth": 42,
-                "Top_hip_girth": 114,
-                "Neck_base_girth": 39,
-                "Shoulder_length": 10,
-                "Lower_arm_length": 24,
-                "Upper_arm_length": 35,
-                "Inside_leg_height": 83
-            }
-        }
+        cache_key = (self.api_url, self.api_key)
+        if not refresh and cache_key in _predefined_avatar_ids:
+            self.avatar_id = _predefined_avatar_ids[cache_key]
+            logger.info("Reusing predefined avatar with ID: %s", self.avatar_id)
+            return self.avatar_id
         
-        print("Creating avatar with predefined measurements")
+        logger.info("Creating avatar with predefined measurements")
         
         # Send the request
-        response = self.make_request("POST", f"{self.avatars_endpoint}/create/from-measurements", data=body)
+        response = self.make_request("POST", f"{self.avatars_endpoint}/create/from-measurements",
+                                     data=_PREDEFINED_AVATAR_BODY)
         
         # Process the response
         if "data" in response and "id" in response["data"]:
             # Store avatar ID as an instance attribute for future operations
             self.avatar_id = response["data"]["id"]
-            print(f"Created predefined avatar with ID: {self.avatar_id}")
+            _predefined_avatar_ids[cache_key] = self.avatar_id
+            logger.info("Created predefined avatar with ID: %s", self.avatar_id)
             return self.avatar_id
                     
         # If we get here, we couldn't extract the avatar ID
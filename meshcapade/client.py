@@ -1,23 +1,274 @@
 """
 Base client for MeshCapade API requests
 """
+import contextlib
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 import requests
+# The package is still initializing when this module is first imported, so its
+# defaults are read as attributes at call time; set_api_key() etc. stay late-bound
+import meshcapade as _pkg
 from .exceptions import APIError, AuthenticationError, ResourceNotFoundError
 
-class BaseClient:
-    """Base client for making requests to the MeshCapade API"""
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+except ImportError:  # orjson is optional; fall back to the stdlib implementation
+    import json
+    json_loads = json.loads
+    
+    def json_dumps(obj):
+        """Serialize obj to UTF-8 encoded JSON bytes, like orjson.dumps"""
+        return json.dumps(obj).encode("utf-8")
+
+# Media types whose bodies are decoded as JSON; str.startswith takes the whole tuple
+_JSON_CONTENT_TYPES = ('application/json', 'application/vnd.api+json')
+
+
+def _cache_lifetime(cache_control):
+    """Return how many seconds a response may be reused without revalidation.
+    
+    Reads max-age from a Cache-Control header value; no-cache or a missing
+    max-age mean the response must be revalidated before every reuse.
+    """
+    lifetime = 0
+    for directive in cache_control.split(","):
+        name, _, value = directive.strip().partition("=")
+        name = name.lower()
+        if name == "no-cache":
+            return 0
+        if name == "max-age" and value.isdigit():
+            lifetime = int(value)
+    return lifetime
+
+# Query parameter values a GET can be collapsed or cached on
+_KEYABLE_PARAM_TYPES = (str, bytes, int, float, type(None))
+
+
+def _request_key(endpoint, params):
+    """Return a hashable key for a GET of endpoint with params, or None if it can't have one.
+    
+    Only dicts of scalar values are keyed. requests also accepts lists of pairs and
+    list values (for repeated parameters); such GETs are sent without being
+    collapsed or cached.
+    """
+    if not params:
+        return (endpoint, ())
+    if not isinstance(params, dict) or not all(isinstance(v, _KEYABLE_PARAM_TYPES) for v in params.values()):
+        return None
+    try:
+        return (endpoint, tuple(sorted(params.items())))
+    except TypeError:  # keys of mixed types can't be sorted
+        return None
+
+
+def require_aiohttp():
+    """Import and return aiohttp, raising a helpful error if it isn't installed
+    
+    aiohttp is imported on first use so sync-only users don't pay for it at import time.
+    """
+    try:
+        import aiohttp
+    except ImportError:
+        raise ImportError("aiohttp is required for the async methods. Install it with `pip install aiohttp`.") from None
+    return aiohttp
+
+
+@contextlib.asynccontextmanager
+async def async_session(session=None):
+    """Yield an aiohttp session, creating (and closing) a pooled one if none is given
+    
+    Passing the same session to several async calls lets them share one
+    connection pool, so TLS handshakes are paid once rather than per call.
+    """
+    if session is not None:
+        yield session
+        return
+    aiohttp = require_aiohttp()
+    connector = aiohttp.TCPConnector(limit=32, ttl_dns_cache=300)
+    async with aiohttp.ClientSession(connector=connector) as new_session:
+        yield new_session
+
+class _ClientBase:
+    """Settings, error mapping and GET deduplication shared by BaseClient and AsyncBaseClient
+    
+    Subclasses define the slots used here: _api_url, _url_prefix, _api_key,
+    _json_headers, _auth_headers and _inflight.
+    """
+    
+    __slots__ = ()
     
-    def __init__(self, api_key=None, api_url=None):
-        from meshcapade import API_URL, API_KEY
-        self.api_url = api_url or API_URL
-        self.api_key = api_key or API_KEY
+    def _configure(self, api_key, api_url, config):
+        """Resolve the API key and URL, raising AuthenticationError if no key is set"""
+        # Explicit arguments win over the given config, which wins over the module defaults
+        if config is not None:
+            api_key = api_key or config.api_key
+            api_url = api_url or config.api_url
+        self.api_url = api_url or _pkg.API_URL
+        self.api_key = api_key or _pkg.API_KEY
         
         if not self.api_key:
             raise AuthenticationError("API key is not set. Please use meshcapade.set_api_key() to set your API key.")
+    
+    @property
+    def api_url(self):
+        """Get the base URL of the API"""
+        return self._api_url
+    
+    @api_url.setter
+    def api_url(self, value):
+        """Set the base URL of the API, normalizing the prefix endpoints are appended to"""
+        self._api_url = value
+        # Exactly one slash between the base URL and the endpoint, however either is written
+        self._url_prefix = value.rstrip("/") + "/"
+    
+    @property
+    def api_key(self):
+        """Get the API key used by this client"""
+        return self._api_key
+    
+    @api_key.setter
+    def api_key(self, value):
+        """Set the API key, rebuilding the default headers sent with every request"""
+        self._api_key = value
+        # Built once here rather than per request; the request paths copy it before
+        # adding headers, so it is never modified
+        self._json_headers = {
+            "Authorization": f"Bearer {value}",
+            "Content-Type": "application/json"
+        }
+        # Multipart uploads leave Content-Type to requests, which adds the boundary
+        self._auth_headers = {"Authorization": f"Bearer {value}"}
+            
+    def _status_error(self, status, reason, url, content):
+        """Return the exception to raise for an API response with an error status (>= 400).
+        
+        Args:
+            status (int): HTTP status code
+            reason (str): HTTP reason phrase
+            url (str): URL the request was sent to
+            content (bytes): Response body
+        """
+        if status == 401:
+            return AuthenticationError("Authentication failed. Please check your API key.")
+        
+        if status == 404:
+            return ResourceNotFoundError(f"Resource not found: {url}")
+        
+        error_msg = f"{status} {reason} for url: {url}"
+        # Parse the error body once; it is both read for the message and attached
+        # to the APIError. orjson.JSONDecodeError subclasses ValueError.
+        try:
+            error_json = json_loads(content)
+        except ValueError:
+            error_json = None
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Error response text: %s", content.decode("utf-8", "replace"))
+        else:
+            if isinstance(error_json, dict) and "error" in error_json:
+                error_msg = f"{error_msg}\nAPI Error: {error_json['error']}"
+            logger.debug("Error response: %s", error_json)
+        return APIError(f"API request failed: {error_msg}", status_code=status, response=error_json)
+    
+    def _decode_body(self, status, headers, content):
+        """Decode the body of a successful API response.
+        
+        Returns:
+            dict: The JSON body, or the status, raw content and headers for non-JSON responses
             
-    def make_request(self, method, endpoint, data=None, headers=None, files=None, params=None):
+        Raises:
+            APIError: If a JSON response cannot be decoded
+        """
+        content_type = headers.get('Content-Type') or ''
+        if content_type.startswith(_JSON_CONTENT_TYPES):
+            if not content:
+                return {}
+            try:
+                return json_loads(content)
+            except ValueError as e:
+                raise APIError(f"Invalid JSON response: {str(e)}", status_code=status)
+        
+        # For non-JSON responses, return a dict with status and raw content
+        return {
+            "status_code": status,
+            "content": content,
+            "headers": dict(headers)
+        }
+    
+    async def _collapse_async(self, key, request):
+        """Await request(), sharing one task between identical concurrent calls.
+        
+        Args:
+            key (tuple): Key identifying the request, built from _request_key()
+            request (callable): Returns the coroutine that sends the request
+        """
+        import asyncio
+        
+        # Keyed by loop too, since a task can only be awaited on the loop running it
+        key = (asyncio.get_running_loop(),) + key
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(request())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # shield() keeps one caller's cancellation from cancelling the request for the others
+        return await asyncio.shield(task)
+
+
+class BaseClient(_ClientBase):
+    """Base client for making requests to the MeshCapade API"""
+    
+    __slots__ = ("_api_url", "_url_prefix", "_api_key", "_json_headers", "_auth_headers", "session", "_owns_session",
+                 "_etag_cache", "_inflight", "_inflight_lock")
+    
+    # Maximum number of cached GET responses (ETag and/or Cache-Control) kept per client
+    etag_cache_size = 128
+    
+    def __init__(self, api_key=None, api_url=None, session=None, config=None, owns_session=False):
+        """
+        Args:
+            api_key (str, optional): API key; defaults to config, then meshcapade.set_api_key()
+            api_url (str, optional): API base URL; defaults to config, then meshcapade.set_api_url()
+            session (requests.Session, optional): Session to send requests on. Defaults to
+                                                 the shared pooled meshcapade.SESSION.
+            config (Config, optional): Connection settings for this client
+            owns_session (bool, optional): Whether close() closes the given session. The shared
+                                          meshcapade.SESSION is never closed by a client.
+        """
+        self._configure(api_key, api_url, config)
+        self.session = session or _pkg.SESSION
+        self._owns_session = owns_session and session is not None and session is not _pkg.SESSION
+        self._etag_cache = {}
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+    
+    def close(self):
+        """Close this client's session, if the client owns it.
+        
+        Only a session passed with owns_session=True is closed. Clients share
+        meshcapade.SESSION by default, and closing it would drop the pooled
+        connections of every other client, so for it this is a no-op.
+        """
+        if self._owns_session:
+            self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def make_request(self, method, endpoint, data=None, headers=None, files=None, params=None, dest=None):
         """Make a request to the MeshCapade API.
         
+        Identical GETs (same endpoint and params, no extra headers) made concurrently
+        from several threads are collapsed into one request, as described in get().
+        
         Args:
             method (str): HTTP method (GET, POST, PUT, DELETE, etc.)
             endpoint (str): API endpoint to call
@@ -25,6 +276,110 @@ class BaseClient:
             headers (dict, optional): Additional headers to include in the request
             files (dict, optional): Files to upload
             params (dict, optional): URL parameters
+            dest (file-like, optional): Writable binary file to stream the response body
+                                       into, in 1 MiB chunks, instead of buffering it
+            
+        Returns:
+            dict: The JSON response from the API. With dest, the status code and
+                  headers of the response, whose body has been written to dest.
+            
+        Raises:
+            APIError: If the request fails
+            AuthenticationError: If authentication fails
+            ResourceNotFoundError: If the requested resource is not found
+        """
+        if method == "GET" and not (headers or files or data) and dest is None:
+            return self.get(endpoint, params)
+        
+        response = self._send(method, endpoint, data=data, headers=headers, files=files, params=params,
+                              stream=dest is not None)
+        if dest is not None:
+            with response:
+                for chunk in response.iter_content(chunk_size=1 << 20):
+                    dest.write(chunk)
+            return {
+                "status_code": response.status_code,
+                "headers": dict(response.headers)
+            }
+        return self._parse_response(response)
+    
+    # Shortcuts for the common requests. They skip make_request()'s handling of
+    # files, extra headers and dest, going straight to _send() with the method fixed.
+    
+    def get(self, endpoint, params=None):
+        """Make a GET request, sharing the result of an identical one already in flight.
+        
+        Callers that collapse onto the same request receive the same dict object, so
+        treat the result as read-only (or copy it) if other threads may be using it.
+        GETs whose params aren't a dict of scalar values are never collapsed.
+        
+        Args:
+            endpoint (str): API endpoint to call
+            params (dict, optional): URL parameters
+            
+        Returns:
+            dict: The JSON response from the API
+        """
+        key = _request_key(endpoint, params)
+        if key is None:
+            return self._parse_response(self._send("GET", endpoint, params=params))
+        return self._single_flight(key, lambda: self._parse_response(self._send("GET", endpoint, params=params)))
+    
+    def post(self, endpoint, data=None, params=None):
+        """Make a POST request with a JSON body and return the decoded response"""
+        return self._parse_response(self._send("POST", endpoint, data=data, params=params))
+    
+    def put(self, endpoint, data=None, params=None):
+        """Make a PUT request with a JSON body and return the decoded response"""
+        return self._parse_response(self._send("PUT", endpoint, data=data, params=params))
+    
+    def delete(self, endpoint, params=None):
+        """Make a DELETE request and return the decoded response"""
+        return self._parse_response(self._send("DELETE", endpoint, params=params))
+    
+    def map(self, method, endpoints, max_workers=10, **kwargs):
+        """Make the same kind of request to several endpoints concurrently.
+        
+        The requests run in a thread pool and share this client's session, so they
+        reuse its pooled connections; max_workers beyond the session's pool size
+        (32 for meshcapade.SESSION) only adds threads waiting for a connection.
+        
+        Args:
+            method (str): HTTP method (GET, POST, PUT, DELETE, etc.)
+            endpoints (list): API endpoints to call
+            max_workers (int, optional): Maximum number of requests in flight. Defaults to 10.
+            **kwargs: Further arguments passed to make_request() for every endpoint
+        
+        Returns:
+            list: The responses, in the order of endpoints. If a request failed, the
+                  exception it raised takes the place of its response.
+        """
+        def request_one(endpoint):
+            try:
+                return self.make_request(method, endpoint, **kwargs)
+            except Exception as e:
+                return e
+        
+        endpoints = list(endpoints)
+        if not endpoints:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(endpoints))) as executor:
+            return list(executor.map(request_one, endpoints))
+    
+    def get_conditional(self, endpoint, params=None):
+        """Make a GET request, revalidating a previous response with its ETag.
+        
+        If an earlier response for the same endpoint and params carried an ETag, it is
+        sent back as If-None-Match. When the server answers 304 Not Modified, the
+        cached body is returned without transferring or parsing it again. A response
+        the server marked as fresh with Cache-Control: max-age is reused without any
+        request until it expires; no-store responses are never cached. Cached and
+        collapsed results are shared between callers, as described in get().
+        
+        Args:
+            endpoint (str): API endpoint to call
+            params (dict, optional): URL parameters
             
         Returns:
             dict: The JSON response from the API
@@ -34,88 +389,194 @@ class BaseClient:
             AuthenticationError: If authentication fails
             ResourceNotFoundError: If the requested resource is not found
         """
-        # Default headers
-        default_headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
+        key = _request_key(endpoint, params)
+        if key is None:
+            return self.get(endpoint, params)
+        cached = self._etag_cache.get(key)
+        if cached and cached[2] > time.monotonic():
+            return cached[1]
+        return self._single_flight(key, lambda: self._revalidate(key, endpoint, params))
+    
+    def _revalidate(self, key, endpoint, params):
+        """Fetch endpoint for get_conditional(), sending the cached ETag and updating the cache"""
+        cached = self._etag_cache.get(key)
+        headers = {"If-None-Match": cached[0]} if cached and cached[0] else None
+        
+        response = self._send("GET", endpoint, headers=headers, params=params)
+        cache_control = response.headers.get("Cache-Control", "")
+        if response.status_code == 304 and cached:
+            # The 304 may extend how long the cached body stays fresh
+            self._etag_cache[key] = (cached[0], cached[1], time.monotonic() + _cache_lifetime(cache_control))
+            return cached[1]
+        
+        result = self._parse_response(response)
+        if "no-store" in cache_control.lower():
+            self._etag_cache.pop(key, None)
+            return result
+        etag = response.headers.get("ETag")
+        lifetime = _cache_lifetime(cache_control)
+        if etag or lifetime:
+            # Keep the cache bounded by evicting the oldest entry
+            if key not in self._etag_cache and len(self._etag_cache) >= self.etag_cache_size:
+                self._etag_cache.pop(next(iter(self._etag_cache)), None)
+            self._etag_cache[key] = (etag, result, time.monotonic() + lifetime)
+        return result
+    
+    def _single_flight(self, key, fetch):
+        """Return fetch(), or the result of an identical fetch already running in another thread.
+        
+        The first caller for a key runs fetch while later callers block on its Future,
+        receiving the same result or exception. The entry is dropped once the fetch
+        finishes, so subsequent calls go to the API again.
+        """
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+        if not leader:
+            return future.result()
         
-        # Merge default headers with any additional headers
-        if headers:
-            default_headers.update(headers)
+        try:
+            try:
+                result = fetch()
+            finally:
+                with self._inflight_lock:
+                    self._inflight.pop(key, None)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        future.set_result(result)
+        return result
+    
+    def _send(self, method, endpoint, data=None, headers=None, files=None, params=None, stream=False):
+        """Send a request to the MeshCapade API and check its status code.
+        
+        Takes the same arguments as make_request(), except that a body to stream is
+        requested with stream=True rather than written to a dest file.
+        
+        Returns:
+            requests.Response: The successful (status < 400) response
             
-        # If we're sending files, remove Content-Type as it will be set automatically
-        if files:
-            default_headers.pop("Content-Type", None)
+        Raises:
+            APIError: If the request fails
+            AuthenticationError: If authentication fails
+            ResourceNotFoundError: If the requested resource is not found
+        """
+        # Pick the prebuilt defaults for the body type, merging in extra headers only when
+        # given; the shared dicts are never modified, since requests copies them
+        base_headers = self._auth_headers if files else self._json_headers
+        default_headers = {**base_headers, **headers} if headers else base_headers
         
         # Construct the full URL
-        url = f"{self.api_url}/{endpoint}"
+        url = self._url_prefix + endpoint.lstrip("/")
         
-        # Debug print the request details
-        print(f"Making {method} request to {url}")
-        if data:
-            print(f"Request data: {data}")
-        if params:
-            print(f"Request params: {params}")
+        # Log the request details. One level check covers all three calls, so requests
+        # with logging off don't pay for three logger calls.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Making %s request to %s", method, url)
+            if data:
+                logger.debug("Request data: %s", data)
+            if params:
+                logger.debug("Request params: %s", params)
         
         # Make the request
         try:
-            response = requests.request(
+            # JSON bodies are pre-encoded (with orjson when available) rather than passed
+            # as json=, which would go through the stdlib encoder
+            response = self.session.request(
                 method=method, 
                 url=url, 
                 headers=default_headers, 
-                json=data if data and not files else None,
-                data=data if files and data else None,
+                data=(data if files else json_dumps(data)) if data else None,
                 files=files,
-                params=params
+                params=params,
+                stream=stream
             )
             
-            # Print the response status
-            print(f"Response status: {response.status_code}")
+            logger.debug("Response status: %s", response.status_code)
             
-            # Handle different status codes
-            if response.status_code == 401:
-                raise AuthenticationError("Authentication failed. Please check your API key.")
+            if response.status_code >= 400:
+                # Closing the response returns its connection to the pool even when it was
+                # requested with stream=True
+                with response:
+                    raise self._status_error(response.status_code, response.reason, url, response.content)
             
-            if response.status_code == 404:
-                raise ResourceNotFoundError(f"Resource not found: {url}")
+            return response
+                
+        except requests.exceptions.RequestException as e:
+            raise APIError(f"Request failed: {str(e)}")
+    
+    def _parse_response(self, response):
+        """Decode a successful API response.
+        
+        Args:
+            response (requests.Response): The response returned by _send()
             
-            # Raise an exception for 4XX/5XX status codes
-            if response.status_code >= 400:
-                error_msg = f"{response.status_code} {response.reason} for url: {url}"
-                try:
-                    error_json = response.json()
-                    if "error" in error_json:
-                        error_msg = f"{error_msg}\nAPI Error: {error_json['error']}"
-                    print(f"Error response: {error_json}")
-                except:
-                    print(f"Error response text: {response.text}")
-                    pass
-                raise APIError(f"API request failed: {error_msg}", status_code=response.status_code)
+        Returns:
+            dict: The JSON body, or the status, raw content and headers for non-JSON responses
             
-            # Parse and return JSON response if available
-            if response.headers.get('Content-Type', '').startswith('application/json') or response.headers.get('Content-Type', '').startswith('application/vnd.api+json'):
-                return response.json()
-            else:
-                # For non-JSON responses, return a dict with status and raw content
-                return {
-                    "status_code": response.status_code,
-                    "content": response.content,
-                    "headers": dict(response.headers)
-                }
+        Raises:
+            APIError: If a JSON response cannot be decoded
+        """
+        return self._decode_body(response.status_code, response.headers, response.content)
+    
+    async def make_request_async(self, session, method, endpoint, data=None, headers=None, params=None):
+        """Make a request to the MeshCapade API on an aiohttp session.
+        
+        This is the non-blocking counterpart of make_request(). The caller owns the
+        session so that several requests can share its connection pool.
+        
+        Concurrent identical GETs (same session, endpoint and params, no extra headers)
+        are collapsed into one request whose result is shared by all callers, e.g. when
+        several coroutines wait on the same avatar. They receive the same dict object,
+        so treat it as read-only. GETs whose params aren't a dict of scalar values are
+        sent uncollapsed.
+        
+        Args:
+            session (aiohttp.ClientSession): Session to send the request on
+            method (str): HTTP method (GET, POST, PUT, DELETE, etc.)
+            endpoint (str): API endpoint to call
+            data (dict, optional): JSON data to include in the request body
+            headers (dict, optional): Additional headers to include in the request
+            params (dict, optional): URL parameters
+            
+        Returns:
+            dict: The JSON response from the API
+            
+        Raises:
+            APIError: If the request fails
+            AuthenticationError: If authentication fails
+            ResourceNotFoundError: If the requested resource is not found
+        """
+        key = _request_key(endpoint, params) if method == "GET" and not (headers or data) else None
+        if key is None:
+            return await self._request_async(session, method, endpoint, data, headers, params)
+        # Keyed by session too: the shared request runs on the first caller's session, so
+        # a caller with another session mustn't fail because that one was closed
+        return await self._collapse_async((session,) + key, lambda: self._request_async(session, method, endpoint, data, headers, params))
+    
+    async def _request_async(self, session, method, endpoint, data=None, headers=None, params=None):
+        """Send one request on an aiohttp session and decode its response.
+        
+        Takes the same arguments as make_request_async().
+        """
+        aiohttp = require_aiohttp()
+        
+        default_headers = {**self._json_headers, **headers} if headers else self._json_headers
+        
+        url = self._url_prefix + endpoint.lstrip("/")
+        logger.debug("Making async %s request to %s", method, url)
+        
+        try:
+            body = json_dumps(data) if data else None
+            async with session.request(method, url, headers=default_headers, data=body, params=params) as response:
+                logger.debug("Response status: %s", response.status)
                 
-        except requests.exceptions.HTTPError as e:
-            # Try to parse error response as JSON
-            try:
-                error_json = response.json()
-                raise APIError(
-                    message=f"API request failed: {error_json.get('message', str(e))}",
-                    status_code=response.status_code,
-                    response=error_json
-                )
-            except ValueError:
-                # If error isn't JSON, just raise the original error
-                raise APIError(f"API request failed: {str(e)}", status_code=response.status_code)
+                content = await response.read()
+                if response.status >= 400:
+                    raise self._status_error(response.status, response.reason, url, content)
+                return self._decode_body(response.status, response.headers, content)
                 
-        except requests.exceptions.RequestException as e:
-            raise APIError(f"Request failed: {str(e)}")
\ No newline at end of file
+        except aiohttp.ClientError as e:
+            raise APIError(f"Request failed: {str(e)}")
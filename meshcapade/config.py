@@ -0,0 +1,23 @@
+"""
+Client configuration for the MeshCapade SDK
+"""
+from dataclasses import dataclass
+
+# Default base URL of the MeshCapade API
+DEFAULT_API_URL = "https://api.meshcapade.com/api/v1"
+
+
+@dataclass(frozen=True)
+class Config:
+    """Immutable connection settings for a MeshCapade client
+    
+    A Config can be shared by any number of clients, e.g. one per tenant in a
+    multi-tenant service, without touching the module-level defaults set via
+    meshcapade.set_api_key() / meshcapade.set_api_url().
+    
+    Args:
+        api_key (str): The API key provided by Meshcapade
+        api_url (str, optional): Base URL of the MeshCapade API
+    """
+    api_key: str
+    api_url: str = DEFAULT_API_URL
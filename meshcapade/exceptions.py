@@ -4,27 +4,34 @@ Custom exceptions for the MeshCapade SDK
 
 class MeshCapadeError(Exception):
     """Base exception for all MeshCapade SDK errors"""
-    pass
+    # Slotted down the hierarchy so attributes don't allocate a per-instance __dict__
+    __slots__ = ()
 
 class AuthenticationError(MeshCapadeError):
     """Exception raised for authentication issues"""
-    pass
+    __slots__ = ()
 
 class APIError(MeshCapadeError):
     """Exception raised for API errors"""
+    __slots__ = ("status_code", "response")
+    
     def __init__(self, message, status_code=None, response=None):
         self.status_code = status_code
         self.response = response
         super().__init__(message)
+    
+    def __reduce__(self):
+        # Slot values aren't in the __dict__ that Exception pickles, so pass them to __init__
+        return (type(self), (*self.args, self.status_code, self.response))
 
 class ValidationError(MeshCapadeError):
     """Exception raised for validation errors"""
-    pass
+    __slots__ = ()
 
 class ResourceNotFoundError(MeshCapadeError):
     """Exception raised when a resource is not found"""
-    pass
+    __slots__ = ()
 
 class TimeoutError(MeshCapadeError):
     """Exception raised when an operation times out"""
-    pass
\ No newline at end of file
+    __slots__ = ()
\ No newline at end of file
@@ -0,0 +1,94 @@
+"""
+Tests for Avatar.create_avatar_from_stream against a local fake API
+"""
+import io
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import meshcapade
+
+
+class _NonSeekableStream(io.RawIOBase):
+    """A readable stream whose tell() fails, like a socket-backed wsgi.input"""
+    
+    def __init__(self, data):
+        self._data = io.BytesIO(data)
+    
+    def readable(self):
+        return True
+    
+    def readinto(self, buffer):
+        chunk = self._data.read(len(buffer))
+        buffer[:len(chunk)] = chunk
+        return len(chunk)
+    
+    def seekable(self):
+        return False
+    
+    def tell(self):
+        raise OSError("stream is not seekable")
+
+
+class _FakeAPI(BaseHTTPRequestHandler):
+    """Serves the avatar endpoints used by create_avatar_from_stream and records uploads"""
+    
+    protocol_version = "HTTP/1.1"
+    uploads = []
+    
+    def log_message(self, *args):
+        pass
+    
+    def _reply(self, status, payload=None):
+        body = json.dumps(payload).encode() if payload is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if self.path.endswith("/images"):
+            host, port = self.server.server_address
+            upload_url = f"http://{host}:{port}/s3/upload?X-Amz-Signature=secret"
+            return self._reply(200, {"data": {"id": "img1", "links": {"upload": upload_url}}})
+        self._reply(200, {"data": {"id": "av1"}})
+    
+    def do_PUT(self):
+        headers = dict(self.headers)
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        self.uploads.append((headers, body))
+        self._reply(200)
+
+
+class CreateAvatarFromStreamTest(unittest.TestCase):
+    
+    def setUp(self):
+        _FakeAPI.uploads = []
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeAPI)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        host, port = self.server.server_address
+        self.avatar = meshcapade.Avatar(api_key="test-key", api_url=f"http://{host}:{port}",
+                                        name="Stream", gender="female")
+    
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+    
+    def test_non_seekable_stream_is_sent_with_content_length_only(self):
+        data = b"x" * 100
+        
+        avatar_id = self.avatar.create_avatar_from_stream(_NonSeekableStream(data), content_length=len(data))
+        
+        self.assertEqual(avatar_id, "av1")
+        self.assertEqual(len(_FakeAPI.uploads), 1)
+        headers, body = _FakeAPI.uploads[0]
+        self.assertEqual(headers.get("Content-Length"), "100")
+        self.assertNotIn("Transfer-Encoding", headers)
+        self.assertEqual(body, data)
+
+
+if __name__ == "__main__":
+    unittest.main()